@@ -36,14 +36,20 @@ Additional Output:
 """
 
 import argparse
+import csv
 import logging
 import os
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+from numba import njit
 
 # Constants
 DEFAULT_CSV_PATH = "transactions.csv"
@@ -56,6 +62,28 @@ REQUIRED_COLUMNS = [
     "Asset Price in CAD",
     "Transaction Value in CAD",
 ]
+ENHANCED_COLUMNS = [
+    "UTC Timestamp",
+    "Asset",
+    "Transaction Type",
+    "Quantity",
+    "Matched Quantity",
+    "Enhanced Quantity",
+    "Sale Price in CAD",
+    "Enhanced Transaction Value in CAD",
+    "Data Status",
+]
+# Explicit Arrow types for the non-date columns so the CSV reader skips type inference.
+COLUMN_TYPES = {
+    "Transaction Type": pa.string(),
+    "Asset": pa.string(),
+    "Quantity": pa.float64(),
+    "Asset Price in CAD": pa.float64(),
+    "Transaction Value in CAD": pa.float64(),
+}
+
+# Bytes of CSV per chunk. The reader keeps a few blocks in flight, so this also bounds its memory.
+CHUNK_SIZE_BYTES = 1 << 20
 
 LOGS_FOLDER = "logs"
 REPORTS_FOLDER = "reports"
@@ -78,182 +106,480 @@ class InvalidDataError(CapitalGainsError):
     pass
 
 
-def validate_dataframe(df: pd.DataFrame) -> None:
-    """Validate that the DataFrame has the required columns and is not empty."""
-    missing_cols = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+class UnsortedInputError(CapitalGainsError):
+    """Raised when chunked transactions are not in chronological order."""
+    pass
+
+
+def validate_columns(columns: List[str]) -> None:
+    """Validate that all required columns are present."""
+    missing_cols = [col for col in REQUIRED_COLUMNS if col not in columns]
     if missing_cols:
         raise InvalidDataError(f"Missing required columns: {', '.join(missing_cols)}")
-    if df.empty:
-        raise InvalidDataError("Input file contains no data")
 
 
-def process_buy(row: pd.Series, buy_lots_fifo: dict, buy_lots_lifo: dict, avg_totals: dict) -> None:
-    """Process a BUY transaction."""
-    ts = row["UTC Timestamp"]
-    asset = row["Asset"]
-    quantity = float(row["Quantity"])
-    unit_price = float(row["Asset Price in CAD"])
-    total_value = float(row["Transaction Value in CAD"])
-    lot = {"quantity": quantity, "price": unit_price, "timestamp": ts}
-    buy_lots_fifo[asset].append(lot.copy())
-    buy_lots_lifo[asset].append(lot.copy())
-    avg_totals[asset]["total_cost"] += total_value
-    avg_totals[asset]["quantity"] += quantity
-
-
-def process_sell(
-    row: pd.Series,
-    buy_lots_fifo: dict,
-    buy_lots_lifo: dict,
-    avg_totals: dict,
-    fifo_gains: dict,
-    lifo_gains: dict,
-    avg_cost_gains: dict,
-    enhanced_transactions: List[Dict]
-) -> None:
-    """Process a SELL transaction, handling missing BUY data by assuming cost=0 for unmatched quantity."""
-    ts = row["UTC Timestamp"]
-    year = ts.year
-    asset = row["Asset"]
-    quantity = float(row["Quantity"])
-    total_value = float(row["Transaction Value in CAD"])
-    sale_price = total_value / quantity
-
-    # For FIFO: determine available matched quantity.
-    available_fifo = sum(lot["quantity"] for lot in buy_lots_fifo[asset])
-    matched_fifo = min(quantity, available_fifo)
-    remaining_fifo = matched_fifo
-    while remaining_fifo > 0 and buy_lots_fifo[asset]:
-        lot = buy_lots_fifo[asset][0]
-        if lot["quantity"] > remaining_fifo:
-            cost_basis = remaining_fifo * lot["price"]
-            fifo_gains[asset][year] += remaining_fifo * sale_price - cost_basis
-            lot["quantity"] -= remaining_fifo
-            remaining_fifo = 0
-        else:
-            cost_basis = lot["quantity"] * lot["price"]
-            fifo_gains[asset][year] += lot["quantity"] * sale_price - cost_basis
-            remaining_fifo -= lot["quantity"]
-            buy_lots_fifo[asset].pop(0)
-    # Enhanced portion for FIFO.
-    enhanced_qty = quantity - matched_fifo
-    if enhanced_qty > 0:
-        fifo_gains[asset][year] += enhanced_qty * sale_price  # cost basis assumed 0
-        # Record enhanced transaction (recorded only once per SELL).
-        enhanced_transactions.append({
-            "UTC Timestamp": row["UTC Timestamp"],
-            "Asset": asset,
-            "Transaction Type": row["Transaction Type"],
-            "Quantity": quantity,
-            "Matched Quantity": matched_fifo,
-            "Enhanced Quantity": enhanced_qty,
-            "Sale Price in CAD": sale_price,
-            "Enhanced Transaction Value in CAD": enhanced_qty * sale_price,
-            "Data Status": "enhanced",
-        })
-
-    # For LIFO: process similarly.
-    available_lifo = sum(lot["quantity"] for lot in buy_lots_lifo[asset])
-    matched_lifo = min(quantity, available_lifo)
-    remaining_lifo = matched_lifo
-    while remaining_lifo > 0 and buy_lots_lifo[asset]:
-        lot = buy_lots_lifo[asset][-1]
-        if lot["quantity"] > remaining_lifo:
-            cost_basis = remaining_lifo * lot["price"]
-            lifo_gains[asset][year] += remaining_lifo * sale_price - cost_basis
-            lot["quantity"] -= remaining_lifo
-            remaining_lifo = 0
-        else:
-            cost_basis = lot["quantity"] * lot["price"]
-            lifo_gains[asset][year] += lot["quantity"] * sale_price - cost_basis
-            remaining_lifo -= lot["quantity"]
-            buy_lots_lifo[asset].pop()
+def timestamps_to_numpy(column: pa.ChunkedArray) -> np.ndarray:
+    """Convert a timestamp column to naive UTC datetime64 values."""
+    if pa.types.is_date(column.type):
+        column = column.cast(pa.timestamp("s"))
+    if pa.types.is_timestamp(column.type):
+        return column.to_numpy()
+    # Arrow only infers ISO 8601; fall back to pandas' more lenient parser for other formats.
+    return pd.to_datetime(column.to_numpy(), utc=True).tz_localize(None).to_numpy()
+
+
+def encode_column(column: pa.ChunkedArray) -> Tuple[np.ndarray, list]:
+    """
+    Dictionary-encode a string column.
+
+    Returns:
+        Tuple of (codes, values), where codes index into the distinct values (nulls included).
+    """
+    encoded = pc.dictionary_encode(column, null_encoding="encode")
+    codes = np.concatenate([chunk.indices.to_numpy() for chunk in encoded.chunks])
+    return codes.astype(np.int64), encoded.chunk(0).dictionary.to_pylist()
+
+
+@njit(cache=True, nogil=True)
+def compute_asset_gains(
+    year_idx,
+    is_buy,
+    is_sell,
+    qty,
+    price,
+    val,
+    fifo_gains,
+    lifo_gains,
+    acb_gains,
+    sold,
+    enhanced_idx,
+    enhanced_matched,
+    lot_price,
+    fifo_qty,
+    lifo_qty,
+    lifo_stack,
+    counters,
+    totals,
+):
+    """
+    Run the FIFO, LIFO and Average Cost calculations over one asset's chronologically sorted transactions.
+
+    Lots are stored by BUY order in the caller's buffers, which must have room for this
+    call's BUYs (see `reserve_lots`). The unit price is immutable and shared; FIFO and
+    LIFO each keep their own remaining quantity. FIFO consumes lots forward from
+    `fifo_head`, LIFO pops them from `lifo_stack`, which holds the BUY indices of its open
+    lots. `counters` (n_bought, fifo_head, lifo_top) and `totals` (avail_fifo, avail_lifo,
+    acb_qty, acb_cost) carry the remaining state, so an asset's history can be fed in
+    successive chronological calls. Gains are accumulated into the per-year arrays and
+    `sold` marks the years that saw at least one SELL.
+
+    Each SELL walks lots one at a time and stops at the last one it touches. Locating the
+    boundary with a cumsum/searchsorted over the open lots would scan all of them on every
+    SELL instead.
+
+    Returns:
+        Number of enhanced SELLs recorded in `enhanced_idx`/`enhanced_matched`.
+    """
+    n_bought = counters[0]
+    fifo_head = counters[1]
+    lifo_top = counters[2]
+    avail_fifo = totals[0]
+    avail_lifo = totals[1]
+    acb_qty = totals[2]
+    acb_cost = totals[3]
+
+    n_enhanced = 0
+    for i in range(len(is_buy)):
+        quantity = qty[i]
+        if is_buy[i]:
+            lot_price[n_bought] = price[i]
+            fifo_qty[n_bought] = quantity
+            lifo_qty[n_bought] = quantity
+            lifo_stack[lifo_top] = n_bought
+            lifo_top += 1
+            n_bought += 1
+            avail_fifo += quantity
+            avail_lifo += quantity
+            acb_cost += val[i]
+            acb_qty += quantity
+        elif is_sell[i]:
+            y = year_idx[i]
+            sold[y] = True
+            sale_price = val[i] / quantity
+
+            # FIFO and LIFO read the same lot_price buffer but are walked in
+            # separate loops: a fused walk has to test both exit conditions
+            # on every step and measured slower, since most SELLs touch only
+            # one or two lots per method.
+
+            # FIFO: consume the oldest lots first.
+            matched_fifo = avail_fifo if avail_fifo < quantity else quantity
+            remaining = matched_fifo
+            gain = 0.0
+            while remaining > 0 and fifo_head < n_bought:
+                lot_qty = fifo_qty[fifo_head]
+                if lot_qty > remaining:
+                    gain += remaining * (sale_price - lot_price[fifo_head])
+                    fifo_qty[fifo_head] = lot_qty - remaining
+                    avail_fifo -= remaining
+                    remaining = 0.0
+                else:
+                    gain += lot_qty * (sale_price - lot_price[fifo_head])
+                    remaining -= lot_qty
+                    avail_fifo -= lot_qty
+                    fifo_head += 1
+            if fifo_head == n_bought:
+                # Drop any floating-point residue once every lot is consumed.
+                avail_fifo = 0.0
+            # Enhanced portion: cost basis assumed 0, recorded once per SELL.
+            enhanced_qty = quantity - matched_fifo
+            if enhanced_qty > 0:
+                gain += enhanced_qty * sale_price
+                enhanced_idx[n_enhanced] = i
+                enhanced_matched[n_enhanced] = matched_fifo
+                n_enhanced += 1
+            fifo_gains[y] += gain
+
+            # LIFO: consume the newest lots first.
+            matched_lifo = avail_lifo if avail_lifo < quantity else quantity
+            remaining = matched_lifo
+            gain = 0.0
+            while remaining > 0 and lifo_top > 0:
+                k = lifo_stack[lifo_top - 1]
+                lot_qty = lifo_qty[k]
+                if lot_qty > remaining:
+                    gain += remaining * (sale_price - lot_price[k])
+                    lifo_qty[k] = lot_qty - remaining
+                    avail_lifo -= remaining
+                    remaining = 0.0
+                else:
+                    gain += lot_qty * (sale_price - lot_price[k])
+                    remaining -= lot_qty
+                    avail_lifo -= lot_qty
+                    lifo_top -= 1
+            if lifo_top == 0:
+                avail_lifo = 0.0
+            if quantity - matched_lifo > 0:
+                gain += (quantity - matched_lifo) * sale_price
+            lifo_gains[y] += gain
+
+            # Average Cost: if no holdings, assume cost=0.
+            # This stays sequential: a SELL removes cost at the current average, so the
+            # average only changes on BUYs and resets once holdings reach zero. It is not
+            # a cumulative sum of BUY cost over BUY quantity.
+            matched_avg = acb_qty if acb_qty < quantity else quantity
+            avg_cost = acb_cost / acb_qty if acb_qty > 0 else 0.0
+            acb_gains[y] += quantity * (sale_price - avg_cost)
+            acb_qty -= quantity
+            acb_qty = acb_qty if acb_qty > 0.0 else 0.0
+            acb_cost -= matched_avg * avg_cost
+            acb_cost = acb_cost if acb_cost > 0.0 else 0.0
+
+    counters[0] = n_bought
+    counters[1] = fifo_head
+    counters[2] = lifo_top
+    totals[0] = avail_fifo
+    totals[1] = avail_lifo
+    totals[2] = acb_qty
+    totals[3] = acb_cost
+    return n_enhanced
+
+
+def new_lot_state() -> list:
+    """Return empty lot buffers, counters and totals for an asset, as `compute_asset_gains` expects."""
+    return [
+        np.empty(0),
+        np.empty(0),
+        np.empty(0),
+        np.empty(0, dtype=np.int64),
+        np.zeros(3, dtype=np.int64),
+        np.zeros(4),
+    ]
+
+
+def reserve_lots(state: list, n_new: int) -> None:
+    """
+    Make room in an asset's lot buffers for `n_new` more BUYs.
+
+    Lots below both the FIFO head and the bottom of the LIFO stack are fully consumed by
+    both methods, so they are dropped before the buffers grow.
+    """
+    lot_price, fifo_qty, lifo_qty, lifo_stack, counters, _ = state
+    n_bought, fifo_head, lifo_top = (int(c) for c in counters)
+    if n_bought + n_new <= len(lot_price):
+        return
+    start = min(fifo_head, int(lifo_stack[0]) if lifo_top else n_bought)
+    n_open = n_bought - start
+    capacity = max(n_open + n_new, 2 * n_open)
+    state[0] = np.empty(capacity)
+    state[1] = np.empty(capacity)
+    state[2] = np.empty(capacity)
+    state[3] = np.empty(capacity, dtype=np.int64)
+    state[0][:n_open] = lot_price[start:n_bought]
+    state[1][:n_open] = fifo_qty[start:n_bought]
+    state[2][:n_open] = lifo_qty[start:n_bought]
+    state[3][:lifo_top] = lifo_stack[:lifo_top] - start
+    counters[0] = n_open
+    counters[1] = fifo_head - start
+
+
+def process_asset(
+    idx: np.ndarray,
+    year_idx: np.ndarray,
+    is_buy: np.ndarray,
+    is_sell: np.ndarray,
+    qty: np.ndarray,
+    price: np.ndarray,
+    val: np.ndarray,
+    fifo_row: np.ndarray,
+    lifo_row: np.ndarray,
+    acb_row: np.ndarray,
+    sold_row: np.ndarray,
+    state: list,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run one asset's transactions (row positions `idx`) through the gains kernel.
 
-    if quantity - matched_lifo > 0:
-        lifo_gains[asset][year] += (quantity - matched_lifo) * sale_price
+    The asset's gains are accumulated into its rows of the (asset, year) matrices and its
+    open lots are carried in `state` (see `new_lot_state`).
 
-    # For Average Cost:
-    available_avg = avg_totals[asset]["quantity"]
-    matched_avg = min(quantity, available_avg)
-    # If no holdings, assume cost=0.
-    avg_cost = (avg_totals[asset]["total_cost"] / available_avg) if available_avg > 0 else 0.0
-    avg_cost_gains[asset][year] += quantity * (sale_price - avg_cost)
-    # Update average totals.
-    avg_totals[asset]["quantity"] = max(0, avg_totals[asset]["quantity"] - quantity)
-    avg_totals[asset]["total_cost"] = max(0, avg_totals[asset]["total_cost"] - matched_avg * avg_cost)
+    Returns:
+        Tuple of (enhanced_rows, enhanced_matched), with enhanced_rows holding row positions.
+    """
+    asset_is_buy = is_buy[idx]
+    reserve_lots(state, int(np.count_nonzero(asset_is_buy)))
+    enhanced_idx = np.empty(len(idx), dtype=np.int64)
+    enhanced_matched = np.empty(len(idx))
+    n_enhanced = compute_asset_gains(
+        year_idx[idx], asset_is_buy, is_sell[idx], qty[idx], price[idx], val[idx],
+        fifo_row, lifo_row, acb_row, sold_row, enhanced_idx, enhanced_matched, *state,
+    )
+    return idx[enhanced_idx[:n_enhanced]], enhanced_matched[:n_enhanced]
+
+
+def resize_matrix(matrix: np.ndarray, n_rows: int, n_cols: int) -> np.ndarray:
+    """Return `matrix` zero-padded to at least (n_rows, n_cols)."""
+    if matrix.shape[0] >= n_rows and matrix.shape[1] >= n_cols:
+        return matrix
+    resized = np.zeros((max(n_rows, matrix.shape[0]), max(n_cols, matrix.shape[1])), dtype=matrix.dtype)
+    resized[:matrix.shape[0], :matrix.shape[1]] = matrix
+    return resized
 
 
 def process_transactions(
-    df: pd.DataFrame,
-) -> Tuple[Dict[str, Dict[int, float]], Dict[str, Dict[int, float]], Dict[str, Dict[int, float]], List[Dict]]:
+    chunks: Iterable[pa.Table],
+) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[Tuple]]:
     """
     Process transactions to calculate yearly capital gains using FIFO, LIFO, and Average Cost methods.
 
-    This function delegates BUY and SELL transactions to dedicated helper functions.
+    The columns are converted to typed NumPy arrays and each asset's transactions are run,
+    independently and in chronological order, through `compute_asset_gains`, which Numba
+    compiles to native code. Assets are processed in parallel on a thread pool.
     If a SELL transaction cannot be fully matched to prior BUYs, the missing portion is assumed to have a cost of 0.
     Enhanced SELL transactions are recorded for further validation.
 
+    Transactions are consumed chunk by chunk, with each asset's open lots carried from one
+    chunk to the next, so only one chunk's arrays are in memory at a time. Each chunk is
+    sorted on its own; a chunk starting before the previous one ended raises
+    UnsortedInputError. A single chunk holding the whole table is always accepted.
+
     Args:
-        df: DataFrame containing transactions with required columns.
+        chunks: Arrow tables containing transactions with required columns, in file order.
 
     Returns:
-        Tuple of (fifo_gains, lifo_gains, avg_cost_gains, enhanced_transactions).
+        Tuple of (assets, years, fifo_gains, lifo_gains, avg_cost_gains, sold, enhanced_transactions).
+        The gains are (asset, year) matrices whose rows follow `assets` and columns follow
+        `years`; `sold` marks the cells with at least one SELL. Enhanced transactions are
+        tuples in ENHANCED_COLUMNS order.
     """
-    validate_dataframe(df)
     logger.info("Starting transaction processing")
-    df.sort_values("UTC Timestamp", inplace=True)
+    assets: List[str] = []
+    asset_index = {}
+    lot_states = []
+    min_year = None
+    last_ts = None
+    n_years = 0
+    fifo_gains = np.zeros((0, 0))
+    lifo_gains = np.zeros((0, 0))
+    avg_cost_gains = np.zeros((0, 0))
+    sold = np.zeros((0, 0), dtype=np.bool_)
+    enhanced_transactions: List[Tuple] = []
+
+    with ThreadPoolExecutor() as pool:
+        for table in chunks:
+            validate_columns(table.column_names)
+            if table.num_rows == 0:
+                continue
+            arr_ts = timestamps_to_numpy(table["UTC Timestamp"])
+            if np.isnat(arr_ts).any():
+                raise InvalidDataError("UTC Timestamp contains missing values")
+            # A stable sort keeps same-timestamp transactions in file order within each asset.
+            order = np.argsort(arr_ts, kind="stable")
+            arr_ts = arr_ts[order]
+            if last_ts is not None and arr_ts[0] < last_ts:
+                raise UnsortedInputError("Transactions are not in chronological order")
+            last_ts = arr_ts[-1]
+
+            # Extract the columns once as typed NumPy arrays for the kernel, in chronological order.
+            years = arr_ts.astype("datetime64[Y]").astype(np.int64) + 1970
+            arr_qty = table["Quantity"].to_numpy()[order]
+            arr_price = table["Asset Price in CAD"].to_numpy()[order]
+            arr_val = table["Transaction Value in CAD"].to_numpy()[order]
+            # Assets and transaction types are small vocabularies: dictionary-encode them into
+            # integer codes once and work on the distinct values only. Other types are ignored.
+            chunk_codes, chunk_assets = encode_column(table["Asset"])
+            for name in chunk_assets:
+                if name not in asset_index:
+                    asset_index[name] = len(assets)
+                    assets.append(name)
+                    lot_states.append(new_lot_state())
+            asset_codes = np.array([asset_index[name] for name in chunk_assets], dtype=np.int64)[chunk_codes[order]]
+            type_codes, type_names = encode_column(table["Transaction Type"])
+            type_names = [name.strip().upper() if name is not None else None for name in type_names]
+            is_buy = np.array([name == "BUY" for name in type_names], dtype=np.bool_)[type_codes[order]]
+            is_sell = np.array([name == "SELL" for name in type_names], dtype=np.bool_)[type_codes[order]]
+
+            # Chunks arrive in chronological order, so the first one holds the earliest year.
+            if min_year is None:
+                min_year = int(years[0])
+            year_idx = (years - min_year).astype(np.int64)
+            n_years = max(n_years, int(year_idx[-1]) + 1)
+            fifo_gains = resize_matrix(fifo_gains, len(assets), n_years)
+            lifo_gains = resize_matrix(lifo_gains, len(assets), n_years)
+            avg_cost_gains = resize_matrix(avg_cost_gains, len(assets), n_years)
+            sold = resize_matrix(sold, len(assets), n_years)
+
+            # Row positions per asset code, in chronological order.
+            asset_order = np.argsort(asset_codes, kind="stable")
+            groups = np.split(asset_order, np.cumsum(np.bincount(asset_codes, minlength=len(assets)))[:-1])
+
+            # Assets are independent and the kernel releases the GIL, so they run concurrently
+            # on a thread pool, each writing to its own matrix rows and lot state.
+            enhanced_idx = []
+            enhanced_matched = []
+            results = pool.map(
+                lambda a: process_asset(
+                    groups[a], year_idx, is_buy, is_sell, arr_qty, arr_price, arr_val,
+                    fifo_gains[a], lifo_gains[a], avg_cost_gains[a], sold[a], lot_states[a],
+                ),
+                [a for a in range(len(assets)) if len(groups[a])],
+            )
+            for rows, matched in results:
+                enhanced_idx.append(rows)
+                enhanced_matched.append(matched)
+
+            # Report enhanced SELLs chronologically across assets. Their columns are gathered up
+            # front so that building the tuples does no per-row array indexing or lookups.
+            enhanced_idx = np.concatenate(enhanced_idx)
+            by_time = np.argsort(enhanced_idx)
+            rows = enhanced_idx[by_time]
+            matched_fifo = np.concatenate(enhanced_matched)[by_time]
+            quantity = arr_qty[rows]
+            sale_price = arr_val[rows] / quantity
+            enhanced_qty = quantity - matched_fifo
+            asset_names = [assets[code] for code in asset_codes[rows]]
+            # Positional values, in ENHANCED_COLUMNS order.
+            enhanced_transactions.extend(
+                (ts, asset, "SELL", q, m, e, p, v, "enhanced")
+                for ts, asset, q, m, e, p, v in zip(
+                    arr_ts[rows], asset_names, quantity, matched_fifo, enhanced_qty, sale_price, enhanced_qty * sale_price
+                )
+            )
+
+    if min_year is None:
+        raise InvalidDataError("Input file contains no data")
+    logger.info("Completed processing transactions")
+    years = np.arange(min_year, min_year + n_years)
+    return assets, years, fifo_gains, lifo_gains, avg_cost_gains, sold, enhanced_transactions
 
-    fifo_gains = defaultdict(lambda: defaultdict(float))
-    lifo_gains = defaultdict(lambda: defaultdict(float))
-    avg_cost_gains = defaultdict(lambda: defaultdict(float))
 
-    buy_lots_fifo = defaultdict(list)
-    buy_lots_lifo = defaultdict(list)
-    avg_totals = defaultdict(lambda: {"quantity": 0.0, "total_cost": 0.0})
-    enhanced_transactions: List[Dict] = []
+def validate_header(csv_path: Path) -> None:
+    """
+    Check the CSV header so that an empty file or missing columns raise InvalidDataError
+    rather than surfacing as pyarrow errors.
+    """
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f), None)
+    if header is None:
+        raise InvalidDataError("Input file contains no data")
+    validate_columns(header)
 
-    for _, row in df.iterrows():
-        ttype = row["Transaction Type"].strip().upper()
-        if ttype == "BUY":
-            process_buy(row, buy_lots_fifo, buy_lots_lifo, avg_totals)
-        elif ttype == "SELL":
-            process_sell(row, buy_lots_fifo, buy_lots_lifo, avg_totals,
-                         fifo_gains, lifo_gains, avg_cost_gains, enhanced_transactions)
 
-    logger.info("Completed processing transactions")
-    return fifo_gains, lifo_gains, avg_cost_gains, enhanced_transactions
+def read_transactions(csv_path: Path) -> pa.Table:
+    """Read the required transaction columns from a CSV file into an Arrow table."""
+    validate_header(csv_path)
+    return pa_csv.read_csv(
+        csv_path,
+        convert_options=pa_csv.ConvertOptions(include_columns=REQUIRED_COLUMNS, column_types=COLUMN_TYPES),
+    )
+
+
+def stream_transactions(csv_path: Path, block_size: int = CHUNK_SIZE_BYTES) -> Iterator[pa.Table]:
+    """
+    Read the required transaction columns from a CSV file as a sequence of Arrow tables.
+
+    Each table covers roughly `block_size` bytes of the file, so the whole file is never
+    held in memory at once.
+    """
+    validate_header(csv_path)
+    reader = pa_csv.open_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=block_size),
+        convert_options=pa_csv.ConvertOptions(include_columns=REQUIRED_COLUMNS, column_types=COLUMN_TYPES),
+    )
+    for batch in reader:
+        yield pa.Table.from_batches([batch])
 
 
 def generate_report_df(
-    fifo_gains: Dict[str, Dict[int, float]],
-    lifo_gains: Dict[str, Dict[int, float]],
-    avg_cost_gains: Dict[str, Dict[int, float]],
+    assets: List[str],
+    years: np.ndarray,
+    fifo_gains: np.ndarray,
+    lifo_gains: np.ndarray,
+    avg_cost_gains: np.ndarray,
+    sold: np.ndarray,
 ) -> pd.DataFrame:
     """
     Generate a DataFrame report comparing FIFO, LIFO, and Average Cost gains per asset and per year.
 
+    The gain matrices are indexed by (asset, year) following `assets` and `years`; only the
+    cells marked in `sold` are reported.
     The DataFrame will have columns: Year, Asset, LIFO G&L, FIFO G&L, ACB G&L.
 
     Returns:
         Report DataFrame.
     """
-    rows = []
-    assets = sorted(set(list(fifo_gains.keys()) + list(lifo_gains.keys()) + list(avg_cost_gains.keys())))
-    for asset in assets:
-        years = set(fifo_gains[asset].keys()).union(lifo_gains[asset].keys(), avg_cost_gains[asset].keys())
-        for year in sorted(years):
-            rows.append({
-                "Year": year,
-                "Asset": asset,
-                "LIFO G&L": lifo_gains[asset].get(year, 0.0),
-                "FIFO G&L": fifo_gains[asset].get(year, 0.0),
-                "ACB G&L": avg_cost_gains[asset].get(year, 0.0),
-            })
-    df_report = pd.DataFrame(rows, columns=["Year", "Asset", "LIFO G&L", "FIFO G&L", "ACB G&L"])
+    a_idx, y_idx = np.nonzero(sold)
+    df_report = pd.DataFrame({
+        "Year": years[y_idx],
+        "Asset": np.asarray(assets, dtype=object)[a_idx],
+        "LIFO G&L": lifo_gains[a_idx, y_idx],
+        "FIFO G&L": fifo_gains[a_idx, y_idx],
+        "ACB G&L": avg_cost_gains[a_idx, y_idx],
+    })
     df_report.sort_values(by=["Year", "Asset"], ascending=[False, True], inplace=True)
     return df_report
 
 
+def write_report_csv(df: pd.DataFrame, path: str) -> None:
+    """
+    Write a DataFrame to CSV with Arrow's vectorised writer.
+
+    The header stays unquoted and whole-second timestamps are written without a fractional
+    part, matching what `DataFrame.to_csv` produced.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type):
+            try:
+                table = table.set_column(i, field.name, table.column(i).cast(pa.timestamp("s")))
+            except pa.ArrowInvalid:
+                pass  # Sub-second values present; keep full precision.
+    with open(path, "wb") as f:
+        f.write((",".join(table.column_names) + "\n").encode())
+        pa_csv.write_csv(table, f, pa_csv.WriteOptions(include_header=False))
+
+
 def setup_logging(run_date: str) -> None:
     """Configure logging to output to both console and a file with the run date."""
     os.makedirs(LOGS_FOLDER, exist_ok=True)
@@ -312,24 +638,29 @@ def main() -> None:
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
         logger.info(f"Reading transactions from {csv_path}")
-        df = pd.read_csv(csv_path, parse_dates=["UTC Timestamp"])
-
-        fifo_gains, lifo_gains, avg_cost_gains, enhanced_transactions = process_transactions(df)
-        report_df = generate_report_df(fifo_gains, lifo_gains, avg_cost_gains)
-        report_df.to_csv(report_path, index=False)
+        try:
+            results = process_transactions(stream_transactions(csv_path))
+        except UnsortedInputError:
+            # Chunks can only be processed as they stream in if the file is chronological.
+            logger.info("Transactions are not in chronological order; sorting the whole file in memory")
+            results = process_transactions([read_transactions(csv_path)])
+
+        assets, years, fifo_gains, lifo_gains, avg_cost_gains, sold, enhanced_transactions = results
+        report_df = generate_report_df(assets, years, fifo_gains, lifo_gains, avg_cost_gains, sold)
+        write_report_csv(report_df, report_path)
         logger.info(f"Capital gains report written to {report_path}")
         print(f"Report written to {report_path}")
 
         # Write enhanced transactions to separate CSV if any exist.
         if enhanced_transactions:
-            enhanced_df = pd.DataFrame(enhanced_transactions)
-            enhanced_df.to_csv(enhanced_path, index=False)
+            enhanced_df = pd.DataFrame.from_records(enhanced_transactions, columns=ENHANCED_COLUMNS)
+            write_report_csv(enhanced_df, enhanced_path)
             logger.info(f"Enhanced transactions report written to {enhanced_path}")
             print(f"Enhanced transactions report written to {enhanced_path}")
         else:
             logger.info("No enhanced transactions to report.")
 
-    except (FileNotFoundError, pd.errors.EmptyDataError) as e:
+    except FileNotFoundError as e:
         logger.error(f"File error: {e}")
         print(f"\nError: {e}")
     except InvalidDataError as e: